@@ -1,25 +1,185 @@
 """requires pyserial"""
-from typing import overload, Union, Literal
+import os
+import re
+import select
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from queue import SimpleQueue
+from threading import Lock, Thread, current_thread
+from time import monotonic, sleep
+from typing import overload, Callable, Union, Literal, Self
+from weakref import WeakMethod
 from instek.types import (
     Volts,
     Amps,
     Ohms,
     Watts,
+    Mode,
 )
-from serial import Serial
-from serial.tools.list_ports import comports
+try:
+    from serial import Serial, SerialException
+    from serial.tools.list_ports import comports
+except ImportError as error:
+    raise ImportError("pyserial is required: pip install pyserial") from error
 
 
 __all__ = [
-    "get_gpds",
+    "GPDX303S",
+    "GPD2303S",
+    "GPD3303S",
+    "GPD4303S",
+    "get_devices",
     "Volts",
     "Amps",
     "Ohms",
     "Watts",
+    "Mode",
 ]
 
 
+# fixed queries are encoded once, keyed by channel where they take one
+_IDN = b"*IDN?\n"
+_STATUS = b"STATUS?\n"
+_VOUT = {1: b"VOUT1?\n", 2: b"VOUT2?\n", 3: b"VOUT3?\n", 4: b"VOUT4?\n"}
+_IOUT = {1: b"IOUT1?\n", 2: b"IOUT2?\n", 3: b"IOUT3?\n", 4: b"IOUT4?\n"}
+_VSET = {1: b"VSET1?\n", 2: b"VSET2?\n", 3: b"VSET3?\n", 4: b"VSET4?\n"}
+_ISET = {1: b"ISET1?\n", 2: b"ISET2?\n", 3: b"ISET3?\n", 4: b"ISET4?\n"}
+_VSET_PREFIX = {1: b"VSET1:", 2: b"VSET2:", 3: b"VSET3:", 4: b"VSET4:"}
+_ISET_PREFIX = {1: b"ISET1:", 2: b"ISET2:", 3: b"ISET3:", 4: b"ISET4:"}
+_TRACKING_COMMANDS = {
+    "Independent": b"TRACK0\n",
+    "Series": b"TRACK1\n",
+    "Parallel": b"TRACK2\n",
+}
+_BAUD = {9600: b"BAUD2\n", 57600: b"BAUD1\n", 115200: b"BAUD0\n"}
+_RCL = {1: b"RCL1\n", 2: b"RCL2\n", 3: b"RCL3\n", 4: b"RCL4\n"}
+_SAV = {1: b"SAV1\n", 2: b"SAV2\n", 3: b"SAV3\n", 4: b"SAV4\n"}
+# on/off commands, indexed by the boolean being set
+_REMOTE = (b"LOCAL\n", b"REMOTE\n")
+_OUT = (b"OUT0\n", b"OUT1\n")
+_BEEP = (b"BEEP0\n", b"BEEP1\n")
+_TRACKING_STATUS = {b"01": "Independent", b"11": "Series", b"10": "Parallel"}
+_MODES = (Mode.ConstantCurrent, Mode.ConstantVoltage)
+_UNITS = {b"V": Volts, b"A": Amps}
+# STATUS? answers with 8 ascii bits, so every possible reply is decoded up front
+# into (mode 1, mode 2, tracking, beep, output), bits 6 and 7 are the baudrate
+_STATUS_TABLE: dict[bytes, tuple[Mode, Mode, str, bool, bool]] = {
+    bits: (
+        _MODES[bits[0] - 0x30],
+        _MODES[bits[1] - 0x30],
+        _TRACKING_STATUS.get(bits[2:4]),
+        bits[4] == 0x31,
+        bits[5] == 0x31,
+    )
+    for bits in (format(pattern, "08b").encode("ascii") for pattern in range(256))
+}
+# manufacturer, model, SN:serial, version
+_IDENTITY = re.compile(
+    r"\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*(?:SN:)?\s*([^,]*?)\s*,\s*(.+?)\s*"
+)
+# every error the supply can answer with, matched in a single scan
+_ERROR = re.compile(rb"Invalid Character|Data out of range|Command not allowed")
+_ERROR_MESSAGES = {
+    b"Invalid Character": "Channel {channel} does not exist",
+    b"Data out of range": "{settings} is out of range",
+    b"Command not allowed": (
+        "Cannot set {settings} on {channel} while in {tracking} mode"
+    ),
+}
+# the supplies enumerate through FTDI usb serial bridges
+_FTDI_VID = 0x0403
+_FTDI_PIDS = frozenset((0x6001, 0x6010, 0x6011, 0x6014, 0x6015))
+_port_cache: tuple[float, list] = None
+
+
+def _configure_port(port: Serial, low_latency: bool = True) -> None:
+    # FTDI adapters hold short replies for up to 16 ms before flushing them
+    # url ports (socket://, rfc2217://, loop://) have no local device to tune
+    if not low_latency or not isinstance(port, Serial) or not port.port:
+        return
+    if sys.platform.startswith("linux"):
+        # resolve /dev/serial/by-id style links to the ttyUSBn they point at
+        name = Path(port.port).resolve().name
+        try:
+            Path(f"/sys/class/tty/{name}/device/latency_timer").write_text("1")
+        except OSError:
+            pass
+        try:
+            port.set_low_latency_mode(True)
+        except (OSError, ValueError):
+            pass
+    elif sys.platform == "win32":
+        try:
+            port.set_buffer_size(rx_size=4096)
+        except (OSError, ValueError):
+            pass
+
+
+class _SerialBus:
+    """one lock per physical port so drivers sharing it never interleave io"""
+
+    lock: Lock
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+
+
+_buses: dict[str, _SerialBus] = {}
+_buses_lock = Lock()
+
+
+def _bus(port: Serial) -> _SerialBus:
+    with _buses_lock:
+        bus = _buses.get(port.port)
+        if bus is None:
+            bus = _buses[port.port] = _SerialBus()
+        return bus
+
+
+class _SerialWorker(Thread):
+    """owns a port's io so callers on any thread are served in submission order"""
+
+    __exchange: WeakMethod
+    __queue: SimpleQueue
+
+    def __init__(
+        self, exchange: Callable[[bytes, int], list[Union[bytes, None]]]
+    ) -> None:
+        super().__init__(daemon=True)
+        # weak so the thread does not keep an abandoned driver, and its port, alive
+        self.__exchange = WeakMethod(exchange)
+        self.__queue = SimpleQueue()
+
+    def submit(self, payload: bytes, replies: int) -> Future:
+        future = Future()
+        self.__queue.put((payload, replies, future))
+        return future
+
+    def stop(self) -> None:
+        self.__queue.put(None)
+        # a driver collected on this thread stops its worker from inside it
+        if current_thread() is not self:
+            self.join()
+
+    def run(self) -> None:
+        while (item := self.__queue.get()) is not None:
+            payload, replies, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            exchange = self.__exchange()
+            if exchange is None:
+                future.set_exception(Exception("Supply has been closed"))
+                continue
+            try:
+                future.set_result(exchange(payload, replies))
+            except Exception as error:
+                future.set_exception(error)
+            exchange = None
+
+
 class GPDX303S:
+    _channels: tuple[int, ...] = (1, 2)
     __port: Serial
     __manufacturer: str
     __model: str
@@ -27,7 +187,15 @@ class GPDX303S:
     __serial: str
     __remote: bool = None
     __beep: bool
+    __output: bool
     __tracking: Literal["Independent", "Series", "Parallel"]
+    __status_time: float = None
+    __status_decoded: tuple[Mode, Mode, str, bool, bool]
+    __setpoints: dict[int, tuple[Volts, Amps]]
+    __bus: _SerialBus
+    __worker: _SerialWorker = None
+    __poller: "select.poll" = None
+    __rx: bytearray
 
     @property
     def manufacturer(self) -> str:
@@ -51,7 +219,9 @@ class GPDX303S:
 
     @remote.setter
     def remote(self, value: bool) -> None:
-        self.__communicate("REMOTE") if value else self.__communicate("LOCAL")
+        if value == self.__remote:
+            return
+        self.__communicate_raw(_REMOTE[bool(value)])
         self.__remote = value
 
     @property
@@ -60,12 +230,12 @@ class GPDX303S:
 
     @baudrate.setter
     def baudrate(self, value: Literal[9600, 57600, 115200]) -> None:
-        if value == 9600:
-            self.__communicate("BAUD2")
-        if value == 57600:
-            self.__communicate("BAUD1")
-        if value == 115200:
-            self.__communicate("BAUD0")
+        command = _BAUD.get(value)
+        if command is None:
+            raise ValueError(f"Unsupported baudrate {value}")
+        if value == self.__port.baudrate:
+            return
+        self.__communicate_raw(command)
         self.__port.baudrate = value
 
     @property
@@ -76,17 +246,23 @@ class GPDX303S:
     def beep(self, value: bool) -> None:
         if value == self.__beep:
             return
-        self.__communicate(f"BEEP{int(value)}")
+        self.__communicate_raw(_BEEP[bool(value)])
         self.__beep = value
+        self.__status_time = None
 
     @property
     def output(self) -> bool:
-        return bool(int(self.__communicate("OUT?")))
+        # kept current by STATUS? and the setters, refresh() picks up panel changes
+        return self.__output
 
     @output.setter
     def output(self, value: bool) -> None:
         self.__prechecks("remote")
-        self.__communicate(f"OUT{int(value)}")
+        if value == self.__output:
+            return
+        self.__communicate_raw(_OUT[bool(value)])
+        self.__output = bool(value)
+        self.__status_time = None
 
     @property
     def tracking(self) -> str:
@@ -94,153 +270,407 @@ class GPDX303S:
 
     @tracking.setter
     def tracking(self, value: Literal["Independent", "Series", "Parallel"]) -> None:
+        command = _TRACKING_COMMANDS.get(value)
+        if command is None:
+            raise ValueError(f"Unsupported tracking {value}")
         self.__prechecks("remote")
         if value == self.__tracking:
             return
-        match value:
-            case "Independent":
-                self.__communicate("TRACK0")
-            case "Series":
-                self.__communicate("TRACK1")
-            case "Parallel":
-                self.__communicate("TRACK2")
+        self.__communicate_raw(command)
         self.__tracking = value
+        # the supply switches its output off when tracking changes
+        self.__output = False
+        self.__status_time = None
+        self.__setpoints.clear()
 
     @property
     def channel_1(self) -> tuple[Volts, Amps]:
-        return self.__configed_values(1)
+        return self._configed_values(1)
 
     @channel_1.setter
     def channel_1(
         self, value: Union[Volts, Amps, tuple[Volts, Amps]]
     ) -> None:
-        self.__configed_values(1, value)
+        self._configed_values(1, value)
 
     @property
     def channel_2(self) -> tuple[Volts, Amps]:
-        return self.__configed_values(2)
+        return self._configed_values(2)
 
     @channel_2.setter
     def channel_2(
         self, value: Union[Volts, Amps, tuple[Volts, Amps]]
     ) -> None:
-        self.__configed_values(2, value)
+        self._configed_values(2, value)
+
+    def refresh(self) -> None:
+        self.__status()
+        self.__read_setpoints()
+
+    def mode(self, channel: Literal[1, 2]) -> Mode:
+        # STATUS? only reports modes for the first two channels
+        if channel not in self._channels:
+            raise Exception(f"Channel {channel} does not exist")
+        if channel not in (1, 2):
+            raise Exception(f"STATUS? has no mode bit for channel {channel}")
+        return self.__status(max_age=0.05)[channel - 1]
 
     def voltage(self, channel: Literal[1, 2]) -> Volts:
-        return Volts(self.__XOUT(channel, "V"))
+        return self.__XOUT(channel, "V")
 
     def current(self, channel: Literal[1, 2]) -> Amps:
-        return Amps(self.__XOUT(channel, "I"))
+        return self.__XOUT(channel, "I")
 
-    def __init__(self, port: Serial, response: str = None) -> None:
+    def measure(self, channel: Literal[1, 2]) -> tuple[Volts, Amps]:
+        if channel not in self._channels:
+            raise Exception(f"Channel {channel} does not exist")
+        # both queries go out in one write so the pair costs one round-trip
+        voltage, current = self.__transact(_VOUT[channel] + _IOUT[channel], 2)
+        return self.__reading(channel, voltage), self.__reading(channel, current)
+
+    def measure_all(self) -> list[tuple[Volts, Amps]]:
+        # every reading and the status go out in one write, replies come in order
+        replies = self.__transact(
+            b"".join(_VOUT[channel] + _IOUT[channel] for channel in self._channels)
+            + _STATUS,
+            2 * len(self._channels) + 1,
+        )
+        *readings, status = replies
+        measurements = []
+        for index, channel in enumerate(self._channels):
+            voltage = self.__reading(channel, readings[2 * index])
+            current = self.__reading(channel, readings[2 * index + 1])
+            measurements.append((voltage, current))
+        if status:
+            self.__decode_status(status)
+        return measurements
+
+    def __init__(
+        self,
+        port: Serial,
+        response: str = None,
+        low_latency: bool = True,
+        threaded: bool = False,
+    ) -> None:
         self.__port = port
+        self.__bus = _bus(port)
+        self.__setpoints = {}
+        self.__rx = bytearray()
+        if not port.is_open:
+            port.open()
+        self.__watch()
+        _configure_port(port, low_latency)
+        if threaded:
+            self.__worker = _SerialWorker(self.__exchange)
+            self.__worker.start()
+        status = None
         if response is None:
-            response = self.__communicate("*IDN?")
+            # identity and status are pipelined so connecting is one round-trip
+            identity, status = self.__transact(_IDN + _STATUS, 2)
+            response = identity.decode("ascii") if identity else None
         if response is None:
-            if port.is_open:
-                port.close()
+            self.close()
             raise Exception("Did not receive response from Supply")
-        items = response.split(",")
-        self.__manufacturer = items[0].strip()
-        self.__model = items[1].strip()
-        self.__serial = items[2].split(":")[1].strip()
-        self.__version = items[3].strip()
-        self.__status()
+        identity = _IDENTITY.fullmatch(response)
+        if identity is None:
+            self.close()
+            raise Exception(f"Unexpected identity from Supply: {response!r}")
+        self.__manufacturer, self.__model, self.__serial, self.__version = (
+            identity.groups()
+        )
+        if status:
+            self.__decode_status(status)
+        else:
+            self.__status()
+        self.__read_setpoints()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # the driver owns the port, release it if close() was never called
+        try:
+            self.close()
+        except (AttributeError, SerialException):
+            pass
+
+    def close(self) -> None:
+        if self.__worker is not None:
+            self.__worker.stop()
+            self.__worker = None
         if self.__port.is_open:
             self.__port.close()
 
-    def __communicate(self, command: str) -> Union[str, None]:
-        while not self.__port.is_open:
+    def __communicate_raw(self, command: bytes) -> Union[str, None]:
+        response = self.__transact(command)[0]
+        if response is None:
+            return None
+        try:
+            return response.decode("ascii")
+        except UnicodeDecodeError:
+            return None
+
+    def __transact(self, payload: bytes, replies: int = 1) -> list[Union[bytes, None]]:
+        if self.__worker is None:
+            return self.__exchange(payload, replies)
+        return self.__worker.submit(payload, replies).result()
+
+    def __exchange(self, payload: bytes, replies: int) -> list[Union[bytes, None]]:
+        with self.__bus.lock:
+            try:
+                self.__write_raw(payload)
+            except (SerialException, OSError):
+                # close a failed port so the next call goes through __reopen
+                self.__rx.clear()
+                self.__port.close()
+                raise
+            return [self.__read_raw() for _ in range(replies)]
+
+    def __write_raw(self, command: bytes) -> None:
+        if not self.__port.is_open:
+            self.__reopen()
+        # drop anything left over from an earlier reply so it is not misread
+        if self.__rx or self.__port.in_waiting:
+            self.__rx.clear()
+            self.__port.reset_input_buffer()
+        self.__port.write(command)
+
+    def __reopen(self, attempts: int = 8) -> None:
+        # only back off when open() actually failed, 1 ms doubling up to 50 ms
+        delay = 0.001
+        for _ in range(attempts - 1):
+            try:
+                self.__port.open()
+                break
+            except SerialException:
+                sleep(delay)
+                delay = min(delay * 2, 0.05)
+        else:
             self.__port.open()
-        self.__port.write(command.encode("ascii") + b"\n")
+        self.__watch()
+
+    def __watch(self) -> None:
+        # on posix wait on the descriptor so a read returns as soon as the
+        # terminator arrives, anything past it stays buffered for the next read
+        self.__poller = None
+        if not hasattr(select, "poll"):
+            return
         try:
-            response = self.__port.readline().decode("ascii").strip()
-        except Exception:
-            response = None
-        self.__port.close()
-        return response
-
-    def __status(self) -> tuple[int, int]:
-        response = self.__communicate("STATUS?")
-        if response is None:
+            descriptor = self.__port.fileno()
+        except (AttributeError, OSError, ValueError):
+            return
+        self.__poller = select.poll()
+        self.__poller.register(descriptor, select.POLLIN)
+
+    def __read_raw(self) -> Union[bytes, None]:
+        # a timeout just yields a short reply and leaves the port open, only a
+        # failed port is closed so the next write reopens it
+        try:
+            return self.__read_line()
+        except (SerialException, OSError):
+            self.__rx.clear()
+            self.__port.close()
+            return None
+
+    def __read_line(self) -> bytes:
+        # replies are framed on the terminator, whatever arrives past it is kept
+        # for the next read since pipelined replies come back in one burst
+        timeout = self.__port.timeout
+        deadline = None if timeout is None else monotonic() + timeout
+        while (end := self.__rx.find(b"\n")) < 0:
+            received = self.__receive(deadline)
+            if not received:
+                end = len(self.__rx)
+                break
+            self.__rx += received
+        line = bytes(self.__rx[:end])
+        del self.__rx[: end + 1]
+        return line.strip()
+
+    def __receive(self, deadline: Union[float, None]) -> bytes:
+        remaining = None
+        if deadline is not None:
+            remaining = max(deadline - monotonic(), 0)
+        if self.__poller is None:
+            if remaining == 0:
+                return b""
+            return self.__port.read(self.__port.in_waiting or 1)
+        if not self.__poller.poll(None if remaining is None else remaining * 1000):
+            return b""
+        return os.read(self.__port.fileno(), 4096)
+
+    def __status(self, max_age: float = 0) -> tuple[Mode, Mode]:
+        # reuse a recent reply so back to back mode reads cost one round-trip
+        # max_age 0 always asks, a coarse clock can report no time has passed
+        if max_age and self.__status_time is not None:
+            if monotonic() - self.__status_time <= max_age:
+                return self.__status_decoded[:2]
+        response = self.__transact(_STATUS)[0]
+        if not response:
             raise Exception("Did not receive response from Supply")
-        mode_1 = int(response[0])
-        mode_2 = int(response[1])
-        match response[2:4]:
-            case "01":
-                self.__tracking = "Independent"
-            case "11":
-                self.__tracking = "Series"
-            case "10":
-                self.__tracking = "Parallel"
-        self.__beep = bool(int(response[4]))
-        # 5 is output but I can directly query it
-        # 6 and 7 is baudrate, not gonna bother because we're obviously connected
+        return self.__decode_status(response)
+
+    def __decode_status(self, response: bytes) -> tuple[Mode, Mode]:
+        decoded = _STATUS_TABLE.get(response[:8])
+        if decoded is None:
+            raise Exception(f"Unexpected status from Supply: {response!r}")
+        self.__status_decoded = decoded
+        self.__status_time = monotonic()
+        mode_1, mode_2, tracking, self.__beep, self.__output = decoded
+        if tracking is not None:
+            self.__tracking = tracking
         return mode_1, mode_2
 
+    def __read_setpoints(self) -> None:
+        # every channel's setpoints in one write, so later reads are served locally
+        replies = self.__transact(
+            b"".join(_VSET[channel] + _ISET[channel] for channel in self._channels),
+            2 * len(self._channels),
+        )
+        for index, channel in enumerate(self._channels):
+            self.__setpoints[channel] = (
+                self.__reading(channel, replies[2 * index]),
+                self.__reading(channel, replies[2 * index + 1]),
+            )
+
     def __prechecks(self, *args: Literal["remote"]) -> None:
         if "remote" in args and self.remote is False:
             raise Exception("Supply is in local mode")
 
     @overload
-    def __configed_values(self, channel: int) -> tuple[Volts, Amps]:
+    def _configed_values(self, channel: int) -> tuple[Volts, Amps]:
         ...
 
     @overload
-    def __configed_values(
+    def _configed_values(
         self, channel: int, value: Union[Volts, Amps, tuple[Volts, Amps]]
     ) -> None:
         ...
 
-    def __configed_values(
+    def _configed_values(
         self,
         channel: int,
         value: Union[Volts, Amps, tuple[Volts, Amps]] = None,
     ) -> Union[tuple[Volts, Amps], None]:
         if value is None:
-            voltage = self.__communicate(f"VSET{channel}?").removesuffix("V")
-            current = self.__communicate(f"ISET{channel}?").removesuffix("A")
-            return Volts(voltage), Amps(current)
-        if isinstance(value, tuple):
+            # setpoints only change when written, so serve them from the cache
+            setpoints = self.__setpoints.get(channel)
+            if setpoints is None:
+                # both queries share one write, the replies come back in order
+                voltage, current = self.__transact(_VSET[channel] + _ISET[channel], 2)
+                voltage = self.__reading(channel, voltage)
+                current = self.__reading(channel, current)
+                setpoints = self.__setpoints[channel] = voltage, current
+            return setpoints
+        voltage = current = None
+        kind = type(value)
+        if kind is Volts:
+            voltage = value
+        elif kind is Amps:
+            current = value
+        elif isinstance(value, tuple):
             voltage, current = value
+            # a swapped or bare number pair would write the wrong setpoints
+            if type(voltage) not in (Volts, type(None)) or type(current) not in (
+                Amps,
+                type(None),
+            ):
+                raise TypeError(
+                    f"Cannot set channel {channel} to ({type(voltage).__name__}, "
+                    f"{type(current).__name__}), expected (Volts, Amps)"
+                )
         else:
-            voltage = value if isinstance(value, Volts) else None
-            current = value if isinstance(value, Amps) else None
-        self.__XSET(channel, "V", voltage)
-        self.__XSET(channel, "I", current)
+            raise TypeError(
+                f"Cannot set channel {channel} to {kind.__name__}, "
+                "expected Volts, Amps or a (Volts, Amps) tuple"
+            )
+        # dropped before writing, so if the supply rejects a setting the next read
+        # asks it what actually changed
+        previous = self.__setpoints.pop(channel, None)
+        if self.__tracking != "Independent":
+            # tracked channels follow each other
+            self.__setpoints.clear()
+        self.__XSET(channel, ("V", voltage), ("I", current))
+        if self.__tracking != "Independent":
+            return
+        if previous is not None:
+            voltage = previous[0] if voltage is None else voltage
+            current = previous[1] if current is None else current
+        if voltage is not None and current is not None:
+            self.__setpoints[channel] = voltage, current
 
     def __XSET(
-        self, channel: int, x: Literal["I", "V"], value: float
-    ) -> Union[str, None]:
-        if value is None:
+        self, channel: int, *values: tuple[Literal["I", "V"], float]
+    ) -> None:
+        commands = []
+        written = []
+        for x, value in values:
+            if value is None:
+                continue
+            prefix = (_VSET_PREFIX if x == "V" else _ISET_PREFIX).get(channel)
+            if prefix is None:
+                raise Exception(f"Channel {channel} does not exist")
+            commands.append(b"%s%.3f\n" % (prefix, float(value)))
+            written.append((x, value))
+        if not commands:
             return
         self.__prechecks("remote")
-        response = self.__communicate(f"{x}SET{channel}:{value}")
-        if "Data out of range" in response:
-            raise Exception(f"{x} {value} is out of range")
-        if "Command not allowed" in response:
-            raise Exception(
-                f"Cannot set {x} on {channel} while in {self.__tracking} mode"
-            )
-
-    def __XOUT(self, channel: int, x: Literal["I", "V"]) -> float:
-        response = self.__communicate(f"{x}OUT{channel}?")
-        if response is None:
-            raise Exception("Did not receive response from Supply")
-        if "Invalid Character" in response:
+        # settings share one write, only a rejected setting gets a reply
+        response = self.__transact(b"".join(commands))[0]
+        self.__status_time = None
+        if response:
+            # the reply does not say which setting was refused
+            settings = " or ".join(f"{x} {value}" for x, value in written)
+            try:
+                self.__check_error(response, channel, settings)
+            except Exception as error:
+                if len(written) == 1:
+                    raise
+                raise Exception(
+                    f"{error}, the other setting may already be applied"
+                    f" so channel {channel} can be partly changed"
+                ) from None
+
+    def __XOUT(self, channel: int, x: Literal["I", "V"]) -> Union[Volts, Amps]:
+        if channel not in self._channels:
             raise Exception(f"Channel {channel} does not exist")
-        if x == "V":
-            return float(response.removesuffix("V"))
-        if x == "I":
-            return float(response.removesuffix("A"))
+        query = (_VOUT if x == "V" else _IOUT)[channel]
+        return self.__reading(channel, self.__transact(query)[0])
+
+    def __reading(
+        self, channel: int, response: Union[bytes, None]
+    ) -> Union[Volts, Amps]:
+        # None is a failed port, an empty reply is a timeout
+        if not response:
+            raise Exception("Did not receive response from Supply")
+        self.__check_error(response, channel)
+        # replies are a number followed by a single unit letter, parsed as bytes
+        unit = _UNITS.get(response[-1:])
+        if unit is None:
+            raise Exception(f"Unexpected reply from Supply: {response!r}")
+        return unit(response[:-1])
+
+    def __check_error(self, response: bytes, channel: int, settings: str = "") -> None:
+        error = _ERROR.search(response)
+        if error is None:
+            return
+        raise Exception(
+            _ERROR_MESSAGES[error[0]].format(
+                channel=channel, settings=settings, tracking=self.__tracking
+            )
+        )
 
     def __RCL(self, value: Literal[1, 2, 3, 4]) -> None:
-        response = self.__communicate(f"RCL{value}")
+        self.__setpoints.clear()
+        response = self.__communicate_raw(_RCL[value])
         if response is not None:
             raise Exception("Could not recall memory")
 
     def __SAV(self, value: Literal[1, 2, 3, 4]) -> None:
-        response = self.__communicate(f"SAV{value}")
+        response = self.__communicate_raw(_SAV[value])
         if response is not None:
             raise Exception("Could not save memory")
 
@@ -254,66 +684,112 @@ class GPD3303S(GPDX303S):
 
 
 class GPD4303S(GPD3303S):
+    _channels: tuple[int, ...] = (1, 2, 3, 4)
+
     @property
     def channel_3(self) -> tuple[Volts, Amps]:
-        return self.__configed_values(3)
+        return self._configed_values(3)
 
     @channel_3.setter
     def channel_3(
         self, value: Union[Volts, Amps, tuple[Volts, Amps]]
     ) -> None:
-        self.__configed_values(3, value)
+        self._configed_values(3, value)
 
     @property
     def channel_4(self) -> tuple[Volts, Amps]:
-        return self.__configed_values(4)
+        return self._configed_values(4)
 
     @channel_4.setter
     def channel_4(
         self, value: Union[Volts, Amps, tuple[Volts, Amps]]
     ) -> None:
-        self.__configed_values(4, value)
+        self._configed_values(4, value)
 
     def voltage(self, channel: Literal[1, 2, 3, 4]) -> Volts:
-        return Volts(self.__XOUT(channel, "V"))
-    
+        return super().voltage(channel)
+
     def current(self, channel: Literal[1, 2, 3, 4]) -> Amps:
-        return Amps(self.__XOUT(channel, "I"))
+        return super().current(channel)
+
+    def measure(self, channel: Literal[1, 2, 3, 4]) -> tuple[Volts, Amps]:
+        return super().measure(channel)
 
 
 def __test(port: Serial) -> tuple[bool, str]:
     try:
-        port.write(b"*IDN?\n")
-        response = port.readline().decode("ascii").strip()
-        port.close()
-    except Exception:
+        port.write(_IDN)
+        response = port.read_until(b"\n", 64).decode("ascii").strip()
+    except (SerialException, UnicodeDecodeError):
         port.close()
         return False, None
     if "instek" in response.lower():
         return True, response
+    port.close()
     return False, None
 
 
-def get_devices() -> list[Union[GPD2303S, GPD3303S, GPD4303S]]:
-    devices = []
-    for port in comports():
-        try:
-            serial_port = Serial(
-                port=port.name,
-                baudrate=9600,
-                bytesize=8,
-                parity="N",
-                stopbits=1,
-                timeout=0.01,
-            )
+def __probe(name: str) -> Union[GPD2303S, GPD3303S, GPD4303S, None]:
+    # configure before opening so the first open does not toggle DTR
+    serial_port = Serial(
+        baudrate=9600,
+        bytesize=8,
+        parity="N",
+        stopbits=1,
+        timeout=0.01,
+        dsrdtr=False,
+    )
+    serial_port.port = name
+    serial_port.dtr = False
+    serial_port.open()
+    try:
+        _configure_port(serial_port)
+        # a driver may already be talking on this port, do not interleave with it
+        with _bus(serial_port).lock:
             success, response = __test(serial_port)
-            if success:
-                if "GPD4303S" in response:
-                    devices.append(GPD4303S(serial_port, response))
-                elif "GPD3303S" in response:
-                    devices.append(GPD3303S(serial_port, response))
-                elif "GPD2303S" in response:
-                    devices.append(GPD2303S(serial_port, response))
-        except Exception:
-            pass
-    return devices
+        if not success:
+            return None
+        # the identity reports the model as GPD-4303S
+        model = response.replace("-", "")
+        if "GPD4303S" in model:
+            return GPD4303S(serial_port, response, low_latency=False)
+        if "GPD3303S" in model:
+            return GPD3303S(serial_port, response, low_latency=False)
+        if "GPD2303S" in model:
+            return GPD2303S(serial_port, response, low_latency=False)
+    except Exception:
+        serial_port.close()
+        raise
+    serial_port.close()
+    return None
+
+
+def __ports(refresh: bool = False) -> list[str]:
+    # enumeration is slow on windows, so reuse it for a few seconds
+    global _port_cache
+    if refresh or _port_cache is None or monotonic() - _port_cache[0] > 5:
+        _port_cache = monotonic(), [
+            port.device
+            for port in comports()
+            if port.vid == _FTDI_VID and port.pid in _FTDI_PIDS
+        ]
+    return _port_cache[1]
+
+
+def get_devices(refresh: bool = False) -> list[Union[GPD2303S, GPD3303S, GPD4303S]]:
+    ports = __ports(refresh)
+    if not ports:
+        return []
+    found = {}
+    # probes are io bound, so overlap them rather than paying each timeout in turn
+    with ThreadPoolExecutor(max_workers=min(32, len(ports))) as executor:
+        futures = {executor.submit(__probe, name): name for name in ports}
+        for future in as_completed(futures):
+            try:
+                device = future.result()
+            except Exception:
+                continue
+            if device is not None:
+                found[futures[future]] = device
+    # hand devices back in port order however the probes finished
+    return [found[name] for name in ports if name in found]
@@ -0,0 +1,76 @@
+"""asyncio front end for the GPD drivers, blocking io runs in worker threads"""
+import asyncio
+from typing import Any, Callable, Literal, Union, Self
+from instek.types import (
+    Volts,
+    Amps,
+    Mode,
+)
+from instek.gpd import (
+    GPD2303S,
+    GPD3303S,
+    GPD4303S,
+    get_devices,
+)
+
+
+__all__ = [
+    "AsyncGPD",
+    "get_devices_async",
+]
+
+
+class AsyncGPD:
+    __device: Union[GPD2303S, GPD3303S, GPD4303S]
+    __lock: asyncio.Lock
+
+    @property
+    def device(self) -> Union[GPD2303S, GPD3303S, GPD4303S]:
+        return self.__device
+
+    def __init__(self, device: Union[GPD2303S, GPD3303S, GPD4303S]) -> None:
+        self.__device = device
+        self.__lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.__call(self.__device.close)
+
+    async def get(self, name: str) -> Any:
+        return await self.__call(getattr, self.__device, name)
+
+    async def set(self, name: str, value: Any) -> None:
+        await self.__call(setattr, self.__device, name, value)
+
+    async def refresh(self) -> None:
+        await self.__call(self.__device.refresh)
+
+    async def voltage(self, channel: Literal[1, 2, 3, 4]) -> Volts:
+        return await self.__call(self.__device.voltage, channel)
+
+    async def current(self, channel: Literal[1, 2, 3, 4]) -> Amps:
+        return await self.__call(self.__device.current, channel)
+
+    async def measure(self, channel: Literal[1, 2, 3, 4]) -> tuple[Volts, Amps]:
+        return await self.__call(self.__device.measure, channel)
+
+    async def measure_all(self) -> list[tuple[Volts, Amps]]:
+        return await self.__call(self.__device.measure_all)
+
+    async def mode(self, channel: Literal[1, 2]) -> Mode:
+        return await self.__call(self.__device.mode, channel)
+
+    async def __call(self, function: Callable, *args: Any) -> Any:
+        # one command at a time per port, other supplies keep running
+        async with self.__lock:
+            return await asyncio.to_thread(function, *args)
+
+
+async def get_devices_async(refresh: bool = False) -> list[AsyncGPD]:
+    devices = await asyncio.to_thread(get_devices, refresh)
+    return [AsyncGPD(device) for device in devices]
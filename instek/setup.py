@@ -7,6 +7,9 @@ setup(
     install_requires=[
         "pyserial",
     ],
+    extras_require={
+        "batch": ["numpy", "numba"],
+    },
     # entry_points={
     #     'console_scripts': [
     #         'instek=instek.cli:main',
@@ -1,6 +1,5 @@
-from enum import Enum
+from enum import IntEnum
 from typing import Self
-from decimal import Decimal
 from typing import Union
 from math import sqrt
 
@@ -14,147 +13,187 @@ __all__ = [
 ]
 
 
-class UnitBase:
-    __value: Decimal
+# zero, one and the whole values the supplies use as limits, shared instead of
+# rebuilt, an int and the equal float find the same instance
+_INTERNED = frozenset((0, 1, 3, 6, 30, 60))
+_interned: dict[tuple[type, float], "UnitBase"] = {}
 
-    def __init__(self, value: Union[Decimal, float, str, int] = 0):
-        if not isinstance(value, (Decimal, int, str, float)):
-            value = str(value)
-        self.__value = value
 
-    def __str__(self) -> str:
-        return f"{round(self.__value, 3)}"
-
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.__value})"
+class UnitBase(float):
+    __slots__ = ()
 
-    def __float__(self) -> float:
-        return self.__value
+    def __new__(cls, value: Union[float, int, str, bytes] = 0) -> Self:
+        if (type(value) is int or type(value) is float) and value in _INTERNED:
+            instance = _interned.get((cls, value))
+            if instance is None:
+                # built from the whole number so -0.0 never becomes the shared zero
+                instance = _interned[cls, value] = super().__new__(cls, int(value))
+            return instance
+        return super().__new__(cls, value)
 
-    def __int__(self) -> int:
-        return int(self.__value)
+    @classmethod
+    def _wrap(cls, value: float) -> Self:
+        # results of arithmetic are already floats, skip the checks in __new__
+        return float.__new__(cls, value)
 
-    def __bool__(self) -> bool:
-        return bool(self.__value)
+    def __str__(self) -> str:
+        return format(self, ".3f")
 
-    def __hash__(self) -> int:
-        return hash(self.__repr__())
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({float(self)})"
 
     def __abs__(self) -> Self:
-        return self.__class__(abs(self.__value))
-
-    def __pow__(self, other: Union[Decimal, int, float, str]) -> Self:
-        return self.__class__(self.__value ** self.__class__(other).__value)
-
-    def __eq__(self, other: Union[Decimal, int, float, str]) -> bool:
-        if isinstance(other, (Decimal, int, float, str, self.__class__)):
-            return self.__value == self.__class__(other).__value
-        raise TypeError(f"Cannot compare {self.__class__.__name__} with {type(other)}")
-
-    def __gt__(self, other: Union[Decimal, int, float, str]) -> bool:
-        if isinstance(other, (Decimal, int, float, str, self.__class__)):
-            return self.__value > self.__class__(other).__value
-        raise TypeError(f"Cannot compare {self.__class__.__name__} with {type(other)}")
-
-    def __lt__(self, other: Union[Decimal, int, float, str]) -> bool:
-        if isinstance(other, (Decimal, int, float, str, self.__class__)):
-            return self.__value < self.__class__(other).__value
-        raise TypeError(f"Cannot compare {self.__class__.__name__} with {type(other)}")
-
-    def __add__(self, other: Union[Decimal, int, float, str]) -> Self:
-        if isinstance(other, (Decimal, int, float, str, self.__class__)):
-            return self.__class__(self.__value + self.__class__(other).__value)
-        raise TypeError(f"Cannot add {self.__class__.__name__} with {type(other)}")
-
-    def __sub__(self, other: Union[Decimal, int, float, str]) -> Self:
-        if isinstance(other, (Decimal, int, float, str, self.__class__)):
-            return self.__class__(self.__value - self.__class__(other).__value)
-        raise TypeError(f"Cannot subtract {self.__class__.__name__} with {type(other)}")
-
-    def __mul__(self, other: Union[Decimal, int, float, str]) -> Self:
-        return self.__class__(self.__value * self.__class__(other).__value)
-
-    def __truediv__(self, other: Union[Decimal, int, float, str]) -> Self:
-        return self.__class__(self.__value / self.__class__(other).__value)
-
-    def __floordiv__(self, other: Union[Decimal, int, float, str]) -> Self:
-        return self.__class__(self.__value // self.__class__(other).__value)
-
-
-def __throw_error(self, other, operation: str) -> None:
-    raise TypeError(
-        f"Cannot {operation} {self.__class__.__name__} by {other.__class__.__name__}"
-    )
+        return type(self)._wrap(abs(float(self)))
+
+    def __neg__(self) -> Self:
+        return type(self)._wrap(-float(self))
+
+    def __pos__(self) -> Self:
+        return self
+
+    def __pow__(self, other: Union[int, float]) -> Self:
+        return type(self)._wrap(float(self) ** other)
+
+    def __add__(self, other: Union[int, float]) -> Self:
+        self.__same_unit(other, "add")
+        return type(self)._wrap(float(self) + other)
+
+    def __sub__(self, other: Union[int, float]) -> Self:
+        self.__same_unit(other, "subtract")
+        return type(self)._wrap(float(self) - other)
+
+    # a plain number on the left keeps the unit, so sum() of readings stays typed
+    def __radd__(self, other: Union[int, float]) -> Self:
+        self.__same_unit(other, "add")
+        return type(self)._wrap(other + float(self))
+
+    def __rsub__(self, other: Union[int, float]) -> Self:
+        self.__same_unit(other, "subtract")
+        return type(self)._wrap(other - float(self))
+
+    def __rmul__(self, other: Union[int, float]) -> Self:
+        return type(self)._wrap(other * float(self))
+
+    # a different unit is never equal, and cannot be ordered against
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, UnitBase) and type(other) is not type(self):
+            return False
+        return float.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, UnitBase) and type(other) is not type(self):
+            return True
+        return float.__ne__(self, other)
+
+    __hash__ = float.__hash__
+
+    def __lt__(self, other: Union[int, float]) -> bool:
+        self.__same_unit(other, "compare")
+        return float.__lt__(self, other)
+
+    def __le__(self, other: Union[int, float]) -> bool:
+        self.__same_unit(other, "compare")
+        return float.__le__(self, other)
+
+    def __gt__(self, other: Union[int, float]) -> bool:
+        self.__same_unit(other, "compare")
+        return float.__gt__(self, other)
+
+    def __ge__(self, other: Union[int, float]) -> bool:
+        self.__same_unit(other, "compare")
+        return float.__ge__(self, other)
+
+    def __same_unit(self, other: object, operation: str) -> None:
+        if isinstance(other, UnitBase) and type(other) is not type(self):
+            raise TypeError(
+                f"Cannot {operation} {type(self).__name__} with {type(other).__name__}"
+            )
+
+    def __mul__(self, other: Union[int, float, "UnitBase"]) -> "UnitBase":
+        pair = (type(self), type(other))
+        operation = _MUL.get(pair)
+        if operation is not None:
+            return operation(self, other)
+        if pair in _FORBIDDEN_MUL:
+            raise TypeError(
+                f"Cannot multiply {type(self).__name__} by {type(other).__name__}"
+            )
+        return type(self)._wrap(float(self) * other)
+
+    def __truediv__(self, other: Union[int, float, "UnitBase"]) -> "UnitBase":
+        pair = (type(self), type(other))
+        operation = _DIV.get(pair)
+        if operation is not None:
+            return operation(self, other)
+        if pair in _FORBIDDEN_DIV:
+            raise TypeError(
+                f"Cannot divide {type(self).__name__} by {type(other).__name__}"
+            )
+        return type(self)._wrap(float(self) / other)
+
+    def __floordiv__(self, other: Union[int, float]) -> Self:
+        return type(self)._wrap(float(self) // other)
 
 
 class Volts(UnitBase):
-    def __mul__(self, other) -> "Watts" | Self:
-        if isinstance(other, Amps):
-            return Watts(self.__value * other.__value)
-        if isinstance(other, (Ohms, Watts)):
-            __throw_error(self, other, "multiply")
-        return super().__mul__(other)
-
-    def __truediv__(self, other) -> "Amps" | "Ohms" | Self:
-        if isinstance(other, Amps):
-            return Ohms(self.__value / other.__value)
-        if isinstance(other, Ohms):
-            return Amps(self.__value / other.__value)
-        if isinstance(other, Watts):
-            return Ohms((self.__value**2) / other.__value)
-        return super().__truediv__(other)
+    __slots__ = ()
 
 
 class Amps(UnitBase):
-    def __mul__(self, other) -> Volts | "Watts" | Self:
-        if isinstance(other, Ohms):
-            return Volts(self.__value * other.__value)
-        if isinstance(other, Volts):
-            return Watts(self.__value * other.__value)
-        if isinstance(other, Watts):
-            __throw_error(self, other, "multiply")
-        return super().__mul__(other)
-
-    def __truediv__(self, other) -> Self:
-        if isinstance(other, (Volts, Ohms, Watts)):
-            __throw_error(self, other, "divide")
-        return super().__truediv__(other)
+    __slots__ = ()
 
 
 class Ohms(UnitBase):
-    def __mul__(self, other) -> Volts | Self:
-        if isinstance(other, Amps):
-            return Volts(self.__value * other.__value)
-        if isinstance(other, Watts):
-            return Volts(sqrt(self.__value / other.__value))
-        if isinstance(other, Volts):
-            __throw_error(self, other, "multiply")
-        return super().__mul__(other)
-
-    def __truediv__(self, other) -> Self:
-        if isinstance(other, (Watts, Volts, Amps)):
-            __throw_error(self, other, "divide")
-        return super().__truediv__(other)
+    __slots__ = ()
 
 
 class Watts(UnitBase):
-    def __mul__(self, other) -> Volts | Self:
-        if isinstance(other, Ohms):
-            return Volts(sqrt(self.__value * other.__value))
-        if isinstance(other, (Volts, Amps)):
-            __throw_error(self, other, "multiply")
-        return super().__mul__(other)
-
-    def __truediv__(self, other) -> Amps | Volts | Self:
-        if isinstance(other, Volts):
-            return Amps(self.__value / other.__value)
-        if isinstance(other, Amps):
-            return Volts(self.__value / other.__value)
-        if isinstance(other, Ohms):
-            return Amps(sqrt(self.__value / other.__value))
-        return super().__truediv__(other)
-
-
-class Mode(Enum):
+    __slots__ = ()
+
+
+# operations between two units keyed by their exact types, one dict probe per op,
+# pairs that are neither listed nor forbidden keep the left unit and scale it
+_MUL = {
+    (Volts, Amps): lambda v, i: Watts._wrap(float(v) * float(i)),
+    (Amps, Ohms): lambda i, r: Volts._wrap(float(i) * float(r)),
+    (Amps, Volts): lambda i, v: Watts._wrap(float(i) * float(v)),
+    (Ohms, Amps): lambda r, i: Volts._wrap(float(r) * float(i)),
+    (Ohms, Watts): lambda r, p: Volts._wrap(sqrt(float(r) * float(p))),
+    (Watts, Ohms): lambda p, r: Volts._wrap(sqrt(float(p) * float(r))),
+}
+_DIV = {
+    (Volts, Amps): lambda v, i: Ohms._wrap(float(v) / float(i)),
+    (Volts, Ohms): lambda v, r: Amps._wrap(float(v) / float(r)),
+    (Volts, Watts): lambda v, p: Ohms._wrap(float(v) ** 2 / float(p)),
+    (Watts, Volts): lambda p, v: Amps._wrap(float(p) / float(v)),
+    (Watts, Amps): lambda p, i: Volts._wrap(float(p) / float(i)),
+    (Watts, Ohms): lambda p, r: Amps._wrap(sqrt(float(p) / float(r))),
+}
+
+
+# pairs that have no meaning as a unit
+_FORBIDDEN_MUL = frozenset(
+    (
+        (Volts, Ohms),
+        (Volts, Watts),
+        (Amps, Watts),
+        (Ohms, Volts),
+        (Watts, Volts),
+        (Watts, Amps),
+    )
+)
+_FORBIDDEN_DIV = frozenset(
+    (
+        (Amps, Volts),
+        (Amps, Ohms),
+        (Amps, Watts),
+        (Ohms, Watts),
+        (Ohms, Volts),
+        (Ohms, Amps),
+    )
+)
+
+
+class Mode(IntEnum):
     ConstantCurrent = 0
     ConstantVoltage = 1
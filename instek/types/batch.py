@@ -0,0 +1,61 @@
+"""unit math over arrays of samples, requires numba"""
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError as error:
+    raise ImportError(
+        "numpy and numba are required: pip install instek[batch]"
+    ) from error
+
+
+__all__ = [
+    "watts",
+    "volts",
+]
+
+
+# contiguous float64 samples in, results written into a preallocated out array,
+# declared up front so the kernels compile (or load from cache) at import
+_SIGNATURE = "void(float64[::1], float64[::1], float64[::1])"
+
+
+@njit(_SIGNATURE, parallel=True, cache=True, fastmath=True)
+def _power(voltage, current, out):
+    for index in prange(voltage.shape[0]):
+        out[index] = voltage[index] * current[index]
+
+
+@njit(_SIGNATURE, parallel=True, cache=True, fastmath=True)
+def _voltage(resistance, power, out):
+    # P = V^2 / R, so V = sqrt(R * P)
+    for index in prange(resistance.shape[0]):
+        out[index] = np.sqrt(resistance[index] * power[index])
+
+
+def __samples(values) -> "np.ndarray":
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+
+def watts(voltage, current) -> "np.ndarray":
+    # a whole logging session at once instead of a Watts object per sample
+    shape = np.shape(voltage)
+    if shape != np.shape(current):
+        raise ValueError(
+            f"Cannot multiply volts of shape {shape} "
+            f"by amps of shape {np.shape(current)}"
+        )
+    out = np.empty(shape, dtype=np.float64).reshape(-1)
+    _power(__samples(voltage), __samples(current), out)
+    return out.reshape(shape)
+
+
+def volts(resistance, power) -> "np.ndarray":
+    shape = np.shape(resistance)
+    if shape != np.shape(power):
+        raise ValueError(
+            f"Cannot multiply ohms of shape {shape} "
+            f"by watts of shape {np.shape(power)}"
+        )
+    out = np.empty(shape, dtype=np.float64).reshape(-1)
+    _voltage(__samples(resistance), __samples(power), out)
+    return out.reshape(shape)